@@ -6,11 +6,28 @@ Generates plots of seismograms and spectrograms for analysis.
 """
 
 import argparse
+import os
 from pathlib import Path
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 
 
+def find_input_files(directory, extension):
+    """
+    Find data files in a directory with a single scandir pass.
+
+    A plain suffix check per entry is cheaper than glob's fnmatch
+    matching and also catches upper-case extensions.
+    """
+    suffix = f".{extension.lower()}"
+    files = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.lower().endswith(suffix):
+                files.append(Path(entry.path))
+    return sorted(files)
+
+
 def plot_csv_data(csv_file, output_dir=None):
     """Plot seismic data from CSV file."""
     import pandas as pd
@@ -100,7 +117,7 @@ def main():
     if input_path.is_file():
         files = [input_path]
     else:
-        files = list(input_path.glob(f"*.{args.format}"))
+        files = find_input_files(input_path, args.format)
     
     if not files:
         print(f"No files found matching *.{args.format}")
@@ -5,11 +5,11 @@ Handles connection, data acquisition, and status monitoring of 3 Geotiny devices
 """
 
 import socket
+import selectors
 import logging
 import threading
 import time
 from datetime import datetime
-from collections import deque
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 
@@ -19,6 +19,9 @@ logger = logging.getLogger(__name__)
 class GeotinyDevice:
     """Manages connection to a single Geotiny seismometer"""
 
+    # Column index of each channel in the ring buffer
+    CHANNEL_COLUMNS = {'X': 0, 'Y': 1, 'Z': 2}
+
     def __init__(self, device_id: str, ip_address: str, port: int = 8080):
         """
         Initialize device connection
@@ -36,13 +39,26 @@ class GeotinyDevice:
         self.connected = False
         self.socket = None
         self.last_connection_attempt = None
-        self.last_data_received = None
-
-        # Data buffers (store last 30 seconds at 100 Hz = 3000 samples)
+        # Epoch seconds (time.time float) -- building a datetime per
+        # received batch is far more expensive than the clock read, so
+        # formatting is deferred to get_status
+        self.last_data_received = 0.0
+
+        # Data buffer (store last 30 seconds at 100 Hz = 3000 samples):
+        # one contiguous float32 ring with a column per channel, written
+        # at _head. Avoids boxing every sample into Python floats and
+        # lets get_buffer slice channels out without per-element copies.
         self.buffer_size = 3000
-        self.channels = {}  # {'X': deque, 'Y': deque, 'Z': deque}
-        for ch in ['X', 'Y', 'Z']:
-            self.channels[ch] = deque(maxlen=self.buffer_size)
+        self._ring = np.empty((self.buffer_size, 3), dtype=np.float32)
+        self._head = 0   # next write index (acquisition thread only)
+        self._count = 0  # valid samples, saturates at buffer_size
+        # Published (head, count) pair. Only the acquisition thread
+        # writes samples, so publishing both indices in one tuple
+        # assignment (atomic under the GIL) after the ring rows are in
+        # place gives readers a consistent snapshot without a lock --
+        # the single-producer ring pattern. Readers have a full buffer
+        # length (30 s) of slack before the producer laps them.
+        self._state = (0, 0)
 
         # Metadata
         self.sampling_rate = 100  # Hz
@@ -54,8 +70,13 @@ class GeotinyDevice:
             'sensitivity': 1.0,  # V/m/s (placeholder)
         }
 
-        # Lock for thread-safe operations
-        self.lock = threading.Lock()
+        # Receive buffer for batched reads: 64 samples per recv_into
+        # call instead of one 12-byte recv per sample, so the syscall
+        # cost is amortised across the batch. _rx_tail tracks bytes of
+        # a partial frame carried over between calls.
+        self._rxbuf = bytearray(64 * 12)
+        self._rxview = memoryview(self._rxbuf)
+        self._rx_tail = 0
 
     def connect(self) -> bool:
         """
@@ -70,10 +91,10 @@ class GeotinyDevice:
             self.socket.connect((self.ip_address, self.port))
             self.connected = True
             self.last_connection_attempt = datetime.utcnow()
-            logger.info(f"Connected to {self.device_id} at {self.ip_address}:{self.port}")
+            logger.info("Connected to %s at %s:%s", self.device_id, self.ip_address, self.port)
             return True
         except socket.error as e:
-            logger.warning(f"Failed to connect to {self.device_id}: {str(e)}")
+            logger.warning("Failed to connect to %s: %s", self.device_id, e)
             self.connected = False
             self.last_connection_attempt = datetime.utcnow()
             return False
@@ -86,60 +107,131 @@ class GeotinyDevice:
             except:
                 pass
         self.connected = False
-        logger.info(f"Disconnected from {self.device_id}")
+        logger.info("Disconnected from %s", self.device_id)
 
     def read_data(self) -> Optional[Tuple[float, float, float]]:
         """
-        Read single data point from device
+        Read available data points from device
+
+        Receives as many complete 12-byte frames (3 floats @ 4 bytes) as
+        fit in one recv_into call and buffers them all; a trailing
+        partial frame is kept for the next call.
 
         Returns:
-            Tuple of (x, y, z) acceleration values or None if no data
+            Tuple of the most recent (x, y, z) values or None if no data
         """
         if not self.connected:
             if not self.connect():
                 return None
 
         try:
-            # Receive 12 bytes (3 floats @ 4 bytes each)
-            data = self.socket.recv(12)
-            if len(data) == 12:
-                x, y, z = np.frombuffer(data, dtype=np.float32)
-                self.last_data_received = datetime.utcnow()
-
-                # Store in circular buffers
-                with self.lock:
-                    self.channels['X'].append(float(x))
-                    self.channels['Y'].append(float(y))
-                    self.channels['Z'].append(float(z))
-
-                return (float(x), float(y), float(z))
-            else:
-                logger.warning(f"Incomplete data received from {self.device_id}")
+            received = self.socket.recv_into(self._rxview[self._rx_tail:])
+            if received == 0:
+                logger.warning("Connection closed by %s", self.device_id)
+                self.disconnect()
                 return None
+
+            total = self._rx_tail + received
+            frames = total // 12
+            if frames == 0:
+                # Not even one complete frame yet; keep the fragment
+                self._rx_tail = total
+                return None
+
+            # View the complete frames as an (N, 3) float32 array and
+            # append whole rows in one _append call, which publishes the
+            # new indices to readers when the rows are in place
+            samples = np.frombuffer(
+                self._rxbuf, dtype=np.float32, count=frames * 3
+            ).reshape(-1, 3)
+            self.last_data_received = time.time()
+
+            self._append(samples)
+
+            x, y, z = samples[-1]
+            latest = (float(x), float(y), float(z))
+
+            # Move any partial trailing frame to the front of the buffer
+            remainder = total - frames * 12
+            if remainder:
+                self._rxbuf[:remainder] = self._rxbuf[frames * 12:total]
+            self._rx_tail = remainder
+
+            return latest
         except socket.timeout:
-            logger.warning(f"Timeout reading from {self.device_id}")
+            logger.warning("Timeout reading from %s", self.device_id)
             self.disconnect()
             return None
         except Exception as e:
-            logger.error(f"Error reading from {self.device_id}: {str(e)}")
+            logger.error("Error reading from %s: %s", self.device_id, e)
             self.disconnect()
             return None
 
-    def get_buffer(self, channel: str = 'Z') -> np.ndarray:
+    def _append(self, samples: np.ndarray):
+        """Write an (N, 3) block of samples into the ring at _head
+
+        Acquisition-thread only: the new indices are published to
+        readers as a single tuple once the rows are written.
+        """
+        n = len(samples)
+        if n >= self.buffer_size:
+            # Block bigger than the ring: keep only the newest samples
+            self._ring[:] = samples[-self.buffer_size:]
+            self._head = 0
+            self._count = self.buffer_size
+            self._state = (self._head, self._count)
+            return
+
+        end = self._head + n
+        if end <= self.buffer_size:
+            self._ring[self._head:end] = samples
+        else:
+            split = self.buffer_size - self._head
+            self._ring[self._head:] = samples[:split]
+            self._ring[:end - self.buffer_size] = samples[split:]
+        self._head = end % self.buffer_size
+        self._count = min(self._count + n, self.buffer_size)
+        self._state = (self._head, self._count)
+
+    @property
+    def buffer_fill(self) -> int:
+        """Number of valid samples currently buffered"""
+        return self._state[1]
+
+    def get_buffer(self, channel: str = 'Z',
+                   samples: Optional[int] = None) -> np.ndarray:
         """
         Get current buffer for a channel
 
         Args:
             channel: 'X', 'Y', or 'Z'
+            samples: If given, return only the most recent N samples
+                     (avoids copying the whole buffer for short windows)
 
         Returns:
-            NumPy array of samples
+            NumPy array of samples (float32, oldest first)
         """
-        with self.lock:
-            if channel in self.channels:
-                return np.array(list(self.channels[channel]))
-            else:
-                return np.array([])
+        col = self.CHANNEL_COLUMNS.get(channel)
+        if col is None:
+            return np.array([], dtype=np.float32)
+
+        # Lock-free read: one consistent snapshot of the write indices,
+        # then plain slices. See the _state comment in __init__.
+        head, count = self._state
+        if samples is not None and samples < count:
+            count = samples
+        if count == 0:
+            return np.array([], dtype=np.float32)
+
+        start = (head - count) % self.buffer_size
+        end = start + count
+        if end <= self.buffer_size:
+            # Unwrapped: one contiguous column slice
+            return self._ring[start:end, col].copy()
+        return np.concatenate((
+            self._ring[start:, col],
+            self._ring[:end - self.buffer_size, col],
+        ))
 
     def get_status(self) -> Dict:
         """Get device status"""
@@ -147,8 +239,11 @@ class GeotinyDevice:
             'device_id': self.device_id,
             'ip_address': self.ip_address,
             'connected': self.connected,
-            'last_data': self.last_data_received.isoformat() if self.last_data_received else None,
-            'buffer_samples': len(self.channels['Z']),
+            'last_data': (
+                datetime.utcfromtimestamp(self.last_data_received).isoformat()
+                if self.last_data_received else None
+            ),
+            'buffer_samples': self._state[1],
             'sampling_rate': self.sampling_rate,
         }
 
@@ -170,6 +265,12 @@ class DeviceManager:
         self.running = False
         self.acquisition_thread = None
 
+        # Short-lived result cache for the dashboard polling endpoints;
+        # the buffers gain at most ~25 samples within the TTL, so
+        # identical requests inside it can share one built response
+        self._result_cache = {}
+        self._result_ttl = 0.25  # seconds
+
         # Configuration (can load from config/geotiny.yml)
         self.device_config = {
             'device_1': {'ip': '192.168.1.100', 'port': 8080},
@@ -213,35 +314,75 @@ class DeviceManager:
             self.acquisition_thread.join(timeout=5)
         logger.info("Data acquisition stopped")
 
+    # Seconds between reconnect attempts for a disconnected device
+    RECONNECT_INTERVAL = 10.0
+
     def _acquisition_loop(self):
-        """Main acquisition loop running in background thread"""
-        retry_count = {did: 0 for did in self.devices}
-
-        while self.running:
-            for device_id, device in self.devices.items():
-                if not device.connected:
-                    # Try to reconnect every 10 seconds
-                    if retry_count[device_id] >= 10:
-                        device.connect()
-                        retry_count[device_id] = 0
-                    else:
-                        retry_count[device_id] += 1
-                else:
-                    # Read data
-                    data = device.read_data()
-                    if data:
-                        retry_count[device_id] = 0  # Reset on success
+        """Main acquisition loop running in background thread
 
-            # Sleep to approximately match sampling times
-            # With 3 devices, try to read ~10 times per second
-            time.sleep(0.033)  # ~30 ms
+        Blocks on a selector across all connected device sockets, so
+        reads happen exactly when data arrives instead of on a fixed
+        33 ms polling cadence: no wakeups while the devices are idle,
+        and no artificial throughput cap when they are not.
+        """
+        sel = selectors.DefaultSelector()
+        registered = {did: None for did in self.devices}
+        last_attempt = {did: 0.0 for did in self.devices}
+
+        def _unregister(device_id):
+            sock = registered[device_id]
+            if sock is not None:
+                try:
+                    sel.unregister(sock)
+                except (KeyError, ValueError, OSError):
+                    # Closed sockets drop out of the selector on
+                    # their own; a stale entry here is harmless
+                    pass
+                registered[device_id] = None
+
+        try:
+            while self.running:
+                now = time.monotonic()
+                for device_id, device in self.devices.items():
+                    if device.connected:
+                        if registered[device_id] is not device.socket:
+                            # New or replaced connection
+                            _unregister(device_id)
+                            sel.register(
+                                device.socket, selectors.EVENT_READ, device
+                            )
+                            registered[device_id] = device.socket
+                    else:
+                        _unregister(device_id)
+                        if now - last_attempt[device_id] >= self.RECONNECT_INTERVAL:
+                            last_attempt[device_id] = now
+                            device.connect()
+
+                # Wake on readable sockets; the timeout bounds how long
+                # a stop request or reconnect check can be delayed
+                for key, _ in sel.select(timeout=1.0):
+                    key.data.read_data()
+        finally:
+            sel.close()
+
+    def _cached(self, key, producer):
+        """Return a memoised result, recomputing once the TTL expires"""
+        hit = self._result_cache.get(key)
+        now = time.monotonic()
+        if hit is not None and now - hit[0] < self._result_ttl:
+            return hit[1]
+        if len(self._result_cache) > 64:
+            self._result_cache.clear()
+        value = producer()
+        self._result_cache[key] = (now, value)
+        return value
 
     def get_device_status(self) -> Dict[str, Dict]:
         """Get status of all devices"""
-        return {
+        return self._cached('status', lambda: {
             device_id: device.get_status()
             for device_id, device in self.devices.items()
-        }
+        })
 
     def get_device_info(self, device_id: str) -> Optional[Dict]:
         """Get detailed info for a device"""
@@ -265,21 +406,24 @@ class DeviceManager:
         if device_id not in self.devices:
             return None
 
+        return self._cached(
+            ('waveform', device_id, channel, samples),
+            lambda: self._build_waveform(device_id, channel, samples),
+        )
+
+    def _build_waveform(self, device_id: str, channel: str,
+                        samples: int) -> Optional[Dict]:
+        """Build the waveform payload (uncached)"""
         device = self.devices[device_id]
-        buffer = device.get_buffer(channel)
+        buffer_samples = device.buffer_fill
+        data = device.get_buffer(channel, samples)
 
-        if len(buffer) == 0:
+        if len(data) == 0:
             return None
 
-        # Get last N samples
-        if len(buffer) > samples:
-            data = buffer[-samples:]
-        else:
-            data = buffer
-
         # Generate time array (in seconds, relative to end of buffer)
         dt = 1.0 / device.sampling_rate
-        times = np.arange(len(data)) * dt - (len(buffer) * dt)
+        times = np.arange(len(data)) * dt - (buffer_samples * dt)
 
         return {
             'device_id': device_id,
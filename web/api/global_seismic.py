@@ -5,8 +5,12 @@ Fetches and manages global earthquake data for the dashboard.
 """
 
 import logging
+import time
 import requests
-import json
+from requests.adapters import HTTPAdapter, Retry
+import numpy as np
+import orjson
+from scipy.spatial import cKDTree
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import threading
@@ -21,6 +25,15 @@ class GlobalSeismicManager:
     USGS_API_BASE = "https://earthquake.usgs.gov/earthquakes/feed/v1.0/summary"
     USGS_GEOJSON_BASE = "https://earthquake.usgs.gov/fdsnws/event/1/query"
 
+    # Supported time periods mapped to days back
+    TIME_PERIOD_DAYS = {
+        '1day': 1,
+        '7days': 7,
+        '30days': 30,
+    }
+
+    EARTH_RADIUS_KM = 6371.0
+
     def __init__(self):
         """Initialize global seismic manager"""
         self.cache = []
@@ -28,6 +41,36 @@ class GlobalSeismicManager:
         self.cache_ttl = 300  # 5 minutes
         self.lock = threading.Lock()
 
+        self._stats_cache = None  # (monotonic timestamp, stats dict)
+
+        # Spatial index over the cached events (built lazily on the
+        # first location query) and the magnitude floor the cache was
+        # fetched with, so searches know whether the cache can answer
+        self._tree = None
+        self._cache_min_mag = None
+
+        # Parallel array of magnitudes for the cached events, so
+        # filtering and statistics run as single NumPy ops instead of
+        # Python loops over dicts
+        self._mag_arr = np.empty(0, dtype=np.float32)
+
+        # Shared session so repeat USGS calls reuse the same keep-alive
+        # connection instead of paying a TCP+TLS handshake each time.
+        # A small pool is enough: everything talks to one USGS host, but
+        # concurrent dashboard requests each need a connection.
+        self.session = requests.Session()
+        self.session.mount(
+            'https://',
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=8,
+                max_retries=Retry(total=2, backoff_factor=0.2),
+            )
+        )
+        # USGS GeoJSON compresses ~5x; ask for gzip explicitly so the
+        # transfer stays small even when urllib3 defaults change
+        self.session.headers['Accept-Encoding'] = 'gzip'
+
     def initialize(self):
         """Initialize manager"""
         logger.info("Initializing GlobalSeismicManager")
@@ -49,19 +92,26 @@ class GlobalSeismicManager:
         try:
             # Check cache
             if self._is_cache_valid():
-                return self._filter_earthquakes(self.cache, min_magnitude)
+                return self._filter_earthquakes(min_magnitude)
 
             # Fetch from USGS
             earthquakes = self._fetch_from_usgs(min_magnitude, time_period)
 
             with self.lock:
                 self.cache = earthquakes
+                self._mag_arr = np.fromiter(
+                    (eq.get('magnitude') or 0.0 for eq in earthquakes),
+                    dtype=np.float32,
+                    count=len(earthquakes),
+                )
+                self._tree = None  # rebuilt lazily from the new events
+                self._cache_min_mag = min_magnitude
                 self.cache_timestamp = datetime.utcnow()
 
             return earthquakes
 
         except Exception as e:
-            logger.error(f"Error getting earthquakes: {str(e)}")
+            logger.error("Error getting earthquakes: %s", e)
             return []
 
     def get_earthquake_detail(self, event_id: str) -> Optional[Dict]:
@@ -76,29 +126,26 @@ class GlobalSeismicManager:
         """
         try:
             url = f"{self.USGS_GEOJSON_BASE}?eventid={event_id}&format=geojson"
-            response = requests.get(url, timeout=5)
+            response = self.session.get(url, timeout=5)
             response.raise_for_status()
 
-            data = response.json()
+            # orjson parses the raw bytes directly and is several times
+            # faster than stdlib json on deeply nested GeoJSON
+            data = orjson.loads(response.content)
             if data.get('features') and len(data['features']) > 0:
                 feature = data['features'][0]
                 return self._format_event(feature)
             return None
 
         except Exception as e:
-            logger.error(f"Error getting earthquake detail: {str(e)}")
+            logger.error("Error getting earthquake detail: %s", e)
             return None
 
     def _fetch_from_usgs(self, min_magnitude: float, time_period: str) -> List[Dict]:
         """Fetch earthquakes from USGS API"""
         try:
             # Map time period to starttime
-            time_map = {
-                '1day': 1,
-                '7days': 7,
-                '30days': 30,
-            }
-            days_back = time_map.get(time_period, 1)
+            days_back = self.TIME_PERIOD_DAYS.get(time_period, 1)
             start_time = (datetime.utcnow() - timedelta(days=days_back)).isoformat()
 
             # Query USGS
@@ -110,66 +157,68 @@ class GlobalSeismicManager:
                 'orderby': 'time-asc'
             }
 
-            response = requests.get(
+            response = self.session.get(
                 self.USGS_GEOJSON_BASE,
                 params=params,
                 timeout=10
             )
             response.raise_for_status()
 
-            data = response.json()
-            earthquakes = []
+            data = orjson.loads(response.content)
+            format_event = self._format_event
+            earthquakes = [
+                event for event in map(format_event, data.get('features', []))
+                if event
+            ]
 
-            for feature in data.get('features', []):
-                event = self._format_event(feature)
-                if event:
-                    earthquakes.append(event)
-
-            logger.info(f"Fetched {len(earthquakes)} earthquakes from USGS")
+            logger.info("Fetched %s earthquakes from USGS", len(earthquakes))
             return earthquakes
 
         except Exception as e:
-            logger.error(f"Error fetching from USGS: {str(e)}")
+            logger.error("Error fetching from USGS: %s", e)
             return []
 
     def _format_event(self, feature: Dict) -> Optional[Dict]:
         """Format USGS feature as event dict"""
         try:
-            props = feature.get('properties', {})
-            geom = feature.get('geometry', {})
-            coords = geom.get('coordinates', [0, 0, 0])
+            # Bind the .get once; this runs ~300 times per feed refresh
+            # with a dozen lookups per event
+            get = feature.get('properties', {}).get
+            coords = feature.get('geometry', {}).get('coordinates', [0, 0, 0])
 
             return {
-                'event_id': props.get('ids', '').lstrip(',').split(',')[0],
-                'magnitude': props.get('mag', 0),
-                'magnitude_type': props.get('magType', 'M'),
+                'event_id': get('ids', '').lstrip(',').split(',')[0],
+                'magnitude': get('mag', 0),
+                'magnitude_type': get('magType', 'M'),
                 'latitude': coords[1],
                 'longitude': coords[0],
                 'depth_km': coords[2],
                 'datetime': datetime.utcfromtimestamp(
-                    props.get('time', 0) / 1000
+                    get('time', 0) / 1000
                 ).isoformat(),
-                'title': props.get('title', ''),
-                'place': props.get('place', ''),
-                'url': props.get('url', ''),
-                'felt_reports': props.get('felt'),
-                'tsunami': props.get('tsunami'),
-                'status': props.get('status'),
+                'title': get('title', ''),
+                'place': get('place', ''),
+                'url': get('url', ''),
+                'felt_reports': get('felt'),
+                'tsunami': get('tsunami'),
+                'status': get('status'),
                 'updated': datetime.utcfromtimestamp(
-                    props.get('updated', 0) / 1000
+                    get('updated', 0) / 1000
                 ).isoformat(),
             }
         except Exception as e:
-            logger.error(f"Error formatting event: {str(e)}")
+            logger.error("Error formatting event: %s", e)
             return None
 
-    def _filter_earthquakes(self, earthquakes: List[Dict],
-                           min_magnitude: float) -> List[Dict]:
-        """Filter earthquakes by magnitude"""
-        return [
-            eq for eq in earthquakes
-            if eq.get('magnitude', 0) >= min_magnitude
-        ]
+    def _filter_earthquakes(self, min_magnitude: float) -> List[Dict]:
+        """Filter cached earthquakes by magnitude"""
+        with self.lock:
+            cache = self.cache
+            # One vectorized comparison instead of a per-dict .get loop
+            matches = np.nonzero(self._mag_arr >= min_magnitude)[0]
+            if len(matches) == len(cache):
+                return list(cache)
+            return [cache[i] for i in matches]
 
     def _is_cache_valid(self) -> bool:
         """Check if cache is still valid"""
@@ -178,12 +227,58 @@ class GlobalSeismicManager:
         age = (datetime.utcnow() - self.cache_timestamp).total_seconds()
         return age < self.cache_ttl
 
+    @staticmethod
+    def _to_unit_vectors(lat_deg, lon_deg) -> np.ndarray:
+        """Convert latitude/longitude degrees to unit vectors on the
+        sphere, so chord distance between points maps one-to-one onto
+        great-circle distance."""
+        lat = np.radians(lat_deg)
+        lon = np.radians(lon_deg)
+        cos_lat = np.cos(lat)
+        return np.column_stack((
+            cos_lat * np.cos(lon),
+            cos_lat * np.sin(lon),
+            np.sin(lat),
+        ))
+
+    def _spatial_tree(self) -> Optional[cKDTree]:
+        """KD-tree over the cached events, built on first use"""
+        if self._tree is None and self.cache:
+            self._tree = cKDTree(self._to_unit_vectors(
+                np.array([eq['latitude'] for eq in self.cache]),
+                np.array([eq['longitude'] for eq in self.cache]),
+            ))
+        return self._tree
+
+    def _search_cached(self, latitude: float, longitude: float,
+                       radius_km: float, min_magnitude: float) -> List[Dict]:
+        """Answer a location query from the cached events"""
+        tree = self._spatial_tree()
+        if tree is None:
+            return []
+
+        # Great-circle radius expressed as 3D chord length
+        angle = min(radius_km / self.EARTH_RADIUS_KM, np.pi)
+        chord = 2.0 * np.sin(angle / 2.0)
+        center = self._to_unit_vectors(latitude, longitude)[0]
+        hits = [
+            i for i in tree.query_ball_point(center, r=chord)
+            if self._mag_arr[i] >= min_magnitude
+        ]
+        # Match the USGS orderby=magnitude, limit=100 contract
+        hits.sort(key=lambda i: self._mag_arr[i], reverse=True)
+        return [self.cache[i] for i in hits[:100]]
+
     def search_earthquakes(self, latitude: float, longitude: float,
                           radius_km: float = 1000,
                           min_magnitude: float = 3.0) -> List[Dict]:
         """
         Search for earthquakes near a location
 
+        Served from the KD-tree over the cached recent events when the
+        cache is fresh and was fetched with a low enough magnitude
+        floor; otherwise falls back to a USGS query.
+
         Args:
             latitude: Center latitude
             longitude: Center longitude
@@ -194,6 +289,13 @@ class GlobalSeismicManager:
             List of earthquakes
         """
         try:
+            if (self._is_cache_valid() and self._cache_min_mag is not None
+                    and min_magnitude >= self._cache_min_mag):
+                with self.lock:
+                    return self._search_cached(
+                        latitude, longitude, radius_km, min_magnitude
+                    )
+
             params = {
                 'latitude': latitude,
                 'longitude': longitude,
@@ -204,29 +306,39 @@ class GlobalSeismicManager:
                 'orderby': 'magnitude'
             }
 
-            response = requests.get(
+            response = self.session.get(
                 self.USGS_GEOJSON_BASE,
                 params=params,
                 timeout=10
             )
             response.raise_for_status()
 
-            data = response.json()
-            earthquakes = []
-
-            for feature in data.get('features', []):
-                event = self._format_event(feature)
-                if event:
-                    earthquakes.append(event)
-
-            return earthquakes
+            data = orjson.loads(response.content)
+            format_event = self._format_event
+            return [
+                event for event in map(format_event, data.get('features', []))
+                if event
+            ]
 
         except Exception as e:
-            logger.error(f"Error searching earthquakes: {str(e)}")
+            logger.error("Error searching earthquakes: %s", e)
             return []
 
     def get_stats(self) -> Dict:
         """Get statistics about cached earthquakes"""
+        # Memoise briefly: the dashboard polls this several times per
+        # second while the underlying cache changes every 5 minutes
+        hit = self._stats_cache
+        now = time.monotonic()
+        if hit is not None and now - hit[0] < 0.5:
+            return hit[1]
+
+        stats = self._compute_stats()
+        self._stats_cache = (now, stats)
+        return stats
+
+    def _compute_stats(self) -> Dict:
+        """Build the statistics payload (uncached)"""
         with self.lock:
             if not self.cache:
                 return {
@@ -235,15 +347,14 @@ class GlobalSeismicManager:
                     'cache_age_seconds': None,
                 }
 
-            magnitudes = [eq.get('magnitude', 0) for eq in self.cache]
             age = (datetime.utcnow() - self.cache_timestamp).total_seconds() \
                 if self.cache_timestamp else None
 
             return {
                 'total_events': len(self.cache),
-                'magnitude_min': float(min(magnitudes)),
-                'magnitude_max': float(max(magnitudes)),
-                'magnitude_mean': float(sum(magnitudes) / len(magnitudes)),
+                'magnitude_min': float(self._mag_arr.min()),
+                'magnitude_max': float(self._mag_arr.max()),
+                'magnitude_mean': float(self._mag_arr.mean()),
                 'cache_age_seconds': age,
                 'last_updated': self.cache_timestamp.isoformat() if self.cache_timestamp else None,
             }
@@ -4,10 +4,13 @@ Spectrum Analyzer Module - FFT and Spectrogram Analysis
 Provides frequency domain analysis for seismic data from Geotiny devices.
 """
 
+import base64
 import logging
+import time
+from functools import lru_cache
 import numpy as np
 from scipy import signal
-from scipy.fft import fft, fftfreq
+from scipy.fft import rfft, rfftfreq
 from datetime import datetime, timedelta
 from typing import Dict, Optional, List
 import threading
@@ -15,6 +18,44 @@ import threading
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _hann_window(n: int) -> np.ndarray:
+    """Hann window of length n, cached so repeated requests with the
+    same window size don't recompute the cosine table."""
+    return signal.windows.hann(n).astype(np.float32)
+
+
+@lru_cache(maxsize=32)
+def _rfft_freqs(n: int, sampling_rate: int) -> np.ndarray:
+    """Frequency bins for an n-point rfft, cached per (n, fs).
+
+    float32 like the rest of the pipeline: the bins only need to label
+    axes, and half-width serialization is a free payload win.
+    """
+    return rfftfreq(n, 1 / sampling_rate).astype(np.float32)
+
+
+def _dominant_frequency(power: np.ndarray, bin_width: float) -> float:
+    """
+    Dominant frequency from a one-sided power spectrum
+
+    Refines the peak bin to sub-bin resolution by fitting a parabola
+    through the three bins around the maximum (ignoring DC), which
+    recovers frequencies between the fs/n grid points.
+    """
+    if len(power) < 3:
+        return 0.0
+    k = int(np.argmax(power[1:])) + 1
+    if k >= len(power) - 1:
+        return float(k * bin_width)
+    y0, y1, y2 = float(power[k - 1]), float(power[k]), float(power[k + 1])
+    denom = y0 - 2 * y1 + y2
+    delta = 0.5 * (y0 - y2) / denom if denom != 0 else 0.0
+    # Keep the correction within half a bin of the discrete peak
+    delta = max(-0.5, min(0.5, delta))
+    return float((k + delta) * bin_width)
+
+
 class SpectrumAnalyzer:
     """Analyzes frequency spectra and spectrograms for seismic data"""
 
@@ -27,7 +68,9 @@ class SpectrumAnalyzer:
         """
         self.sampling_rate = sampling_rate
         self.nyquist_freq = sampling_rate / 2
-        self.cache = {}  # Simple caching mechanism
+        self.cache = {}  # (method, device, window, channel) -> (timestamp, result)
+        self.cache_ttl = 2.0  # seconds; buffers only gain ~200 samples in that time
+        self._synth_cache = {}  # samples -> precomputed sinusoid baseline
 
     def analyze(self, device_id: str, time_window: str = '1min',
                 channel: str = 'Z') -> Dict:
@@ -42,6 +85,10 @@ class SpectrumAnalyzer:
         Returns:
             Dict with FFT, spectrogram, and statistics
         """
+        cached = self._cache_get(('analyze', device_id, time_window, channel))
+        if cached is not None:
+            return cached
+
         try:
             # Get data for the time window
             samples = self._get_sample_count(time_window)
@@ -50,20 +97,21 @@ class SpectrumAnalyzer:
             if data is None or len(data) < 2:
                 return {'error': 'Insufficient data'}
 
-            # Apply window function to reduce spectral leakage
-            window = signal.hann(len(data))
-            windowed_data = data * window
-
-            # Compute FFT
-            fft_result = self._compute_fft(windowed_data)
+            # Statistics read the raw samples, so they run first; the
+            # later stages then share the one fetched buffer. Demeaning
+            # happens once, in place, for both the FFT and spectrogram
+            # (whose per-segment detrend then has nothing left to do).
+            stats = self._compute_statistics(data)
+            data -= np.float32(stats['mean'])
 
-            # Compute spectrogram
             spec_result = self._compute_spectrogram(data)
 
-            # Compute statistics
-            stats = self._compute_statistics(data)
+            # Apply window function to reduce spectral leakage, again
+            # in place -- the spectrogram has taken its copies by now
+            windowed_data = np.multiply(data, _hann_window(len(data)), out=data)
+            fft_result = self._compute_fft(windowed_data)
 
-            return {
+            result = {
                 'device_id': device_id,
                 'channel': channel,
                 'time_window': time_window,
@@ -74,8 +122,10 @@ class SpectrumAnalyzer:
                 'statistics': stats,
                 'timestamp': datetime.utcnow().isoformat(),
             }
+            self._cache_put(('analyze', device_id, time_window, channel), result)
+            return result
         except Exception as e:
-            logger.error(f"Error in spectrum analysis: {str(e)}")
+            logger.error("Error in spectrum analysis: %s", e)
             return {'error': str(e)}
 
     def compute_fft(self, device_id: str, time_window: str = '1min',
@@ -86,6 +136,10 @@ class SpectrumAnalyzer:
         Returns:
             Dict with frequency and magnitude arrays
         """
+        cached = self._cache_get(('fft', device_id, time_window, channel))
+        if cached is not None:
+            return cached
+
         try:
             samples = self._get_sample_count(time_window)
             data = self._get_data_from_device(device_id, channel, samples)
@@ -93,40 +147,114 @@ class SpectrumAnalyzer:
             if data is None or len(data) < 2:
                 return {'error': 'Insufficient data'}
 
-            # Remove mean
-            data = data - np.mean(data)
+            # Remove mean and apply the Hann window in place; the fetch
+            # returns a fresh array we own, so no copy is needed
+            data -= np.float32(np.mean(data, dtype=np.float64))
+            windowed_data = np.multiply(data, _hann_window(len(data)), out=data)
 
-            # Apply Hann window
-            window = signal.hann(len(data))
-            windowed_data = data * window
-
-            # Compute FFT
+            # Compute FFT (real input, so rfft does half the work of fft)
             n = len(windowed_data)
-            fft_vals = np.abs(fft(windowed_data))[:n // 2]
-            freqs = fftfreq(n, 1 / self.sampling_rate)[:n // 2]
-
-            # Convert to dB scale
-            fft_db = 20 * np.log10(fft_vals + 1e-10)
+            fft_result = rfft(windowed_data, workers=-1)
+            freqs = _rfft_freqs(n, self.sampling_rate)
+
+            # |Y|^2 via real^2 + imag^2 avoids np.abs's overflow-safe
+            # hypot; the dB scale comes straight from the power, so the
+            # sqrt only runs once for the linear magnitude output
+            power = fft_result.real ** 2 + fft_result.imag ** 2
+            fft_vals = np.sqrt(power)
+            dominant = _dominant_frequency(power, self.sampling_rate / n)
+
+            # Convert to dB scale in place (10*log10 of power ==
+            # 20*log10 of magnitude); power has no readers after this,
+            # so the whole dB pass runs without a fresh allocation
+            power += 1e-20
+            fft_db = np.log10(power, out=power)
+            fft_db *= 10
 
             # Normalize
-            fft_db = fft_db - np.max(fft_db)
+            fft_db -= np.max(fft_db)
 
-            return {
+            result = {
                 'device_id': device_id,
                 'channel': channel,
-                'frequencies': freqs.tolist(),
-                'magnitude_db': fft_db.tolist(),
-                'magnitude_linear': fft_vals.tolist(),
+                'frequencies': freqs,
+                'magnitude_db': fft_db,
+                'magnitude_linear': fft_vals,
                 'nyquist_frequency': float(self.nyquist_freq),
                 'frequency_resolution': float(self.sampling_rate / n),
+                'dominant_frequency': dominant,
                 'timestamp': datetime.utcnow().isoformat(),
             }
+            self._cache_put(('fft', device_id, time_window, channel), result)
+            return result
         except Exception as e:
-            logger.error(f"Error computing FFT: {str(e)}")
+            logger.error("Error computing FFT: %s", e)
+            return {'error': str(e)}
+
+    def compute_fft_batch(self, device_id: str, time_window: str = '1min',
+                          channels: Optional[List[str]] = None) -> Dict:
+        """
+        Compute FFTs for several channels with one batched transform
+
+        Stacking the channels into a (channels, samples) array lets a
+        single rfft call amortize plan setup across the batch and
+        parallelize across signals instead of within one.
+
+        Returns:
+            Dict with shared frequency axis and per-channel magnitudes
+        """
+        channels = channels or ['X', 'Y', 'Z']
+        try:
+            samples = self._get_sample_count(time_window)
+            traces = []
+            found = []
+            for ch in channels:
+                data = self._get_data_from_device(device_id, ch, samples)
+                if data is not None and len(data) >= 2:
+                    traces.append(data)
+                    found.append(ch)
+
+            if not traces:
+                return {'error': 'Insufficient data'}
+
+            # Align on the shortest trace so the stack is rectangular
+            n = min(len(t) for t in traces)
+            stack = np.stack([t[-n:] for t in traces])
+
+            # Demean and window every row, then one batched FFT
+            stack -= stack.mean(axis=1, keepdims=True)
+            stack *= _hann_window(n)
+            fft_result = rfft(stack, axis=-1, workers=-1)
+            power = fft_result.real ** 2 + fft_result.imag ** 2
+
+            freqs = _rfft_freqs(n, self.sampling_rate)
+            bin_width = self.sampling_rate / n
+            channel_results = {}
+            for i, ch in enumerate(found):
+                fft_db = 10 * np.log10(power[i] + 1e-20)
+                fft_db -= np.max(fft_db)
+                channel_results[ch] = {
+                    'magnitude_db': fft_db,
+                    'dominant_frequency': _dominant_frequency(
+                        power[i], bin_width
+                    ),
+                }
+
+            return {
+                'device_id': device_id,
+                'time_window': time_window,
+                'frequencies': freqs,
+                'channels': channel_results,
+                'nyquist_frequency': float(self.nyquist_freq),
+                'frequency_resolution': float(bin_width),
+                'timestamp': datetime.utcnow().isoformat(),
+            }
+        except Exception as e:
+            logger.error("Error computing batch FFT: %s", e)
             return {'error': str(e)}
 
     def compute_spectrogram(self, device_id: str, time_window: str = '10min',
-                           channel: str = 'Z') -> Dict:
+                           channel: str = 'Z', quantize: bool = False) -> Dict:
         """
         Compute spectrogram (power vs time vs frequency)
 
@@ -134,10 +262,19 @@ class SpectrumAnalyzer:
             device_id: Device identifier
             time_window: Time window for analysis
             channel: Channel to analyze
+            quantize: Return power as base64 uint8 quantized over an
+                      80 dB range instead of a float array. 1 byte per
+                      bin instead of ~8 of JSON text; the canvas only
+                      renders ~8 bits of dynamic range anyway.
 
         Returns:
             Dict with spectrogram data
         """
+        key = ('spectrogram', device_id, time_window, channel, quantize)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         try:
             samples = self._get_sample_count(time_window)
             data = self._get_data_from_device(device_id, channel, samples)
@@ -146,30 +283,28 @@ class SpectrumAnalyzer:
                 return {'error': 'Insufficient data'}
 
             # Compute spectrogram using scipy
-            # nperseg: window length (256 samples = ~2.5 sec at 100 Hz)
-            # noverlap: overlap between windows (75% = 192 samples)
+            # Window length 256 samples = ~2.5 sec at 100 Hz, with 75%
+            # overlap (192 samples). Passing the cached window array
+            # instead of 'hann' skips the per-call window rebuild.
             freqs, times, Sxx = signal.spectrogram(
                 data,
                 fs=self.sampling_rate,
-                window='hann',
-                nperseg=256,
+                window=_hann_window(256),
                 noverlap=192,
                 scaling='density'
             )
 
-            # Convert to dB scale
-            Sxx_db = 10 * np.log10(Sxx + 1e-10)
-
-            # Create time array relative to start
-            time_seconds = times.tolist()
+            # Convert to dB scale; ascontiguousarray because the
+            # spectrogram comes back Fortran-ordered and orjson needs
+            # C-contiguous data to serialize it without a copy
+            Sxx_db = np.ascontiguousarray(10 * np.log10(Sxx + 1e-10))
 
-            return {
+            result = {
                 'device_id': device_id,
                 'channel': channel,
                 'time_window': time_window,
-                'frequencies': freqs.tolist(),
-                'time_seconds': time_seconds,
-                'power_db': Sxx_db.tolist(),
+                'frequencies': freqs.astype(np.float32),
+                'time_seconds': times.astype(np.float32),
                 'frequency_resolution': float(freqs[1] - freqs[0]) if len(freqs) > 1 else 0,
                 'time_resolution': float(times[1] - times[0]) if len(times) > 1 else 0,
                 'color_scale': {
@@ -179,28 +314,66 @@ class SpectrumAnalyzer:
                 },
                 'timestamp': datetime.utcnow().isoformat(),
             }
+
+            if quantize:
+                # Clip to the top 80 dB and rescale to uint8; the client
+                # rebuilds values as vmin + q * (vmax - vmin) / 255
+                vmax = float(np.max(Sxx_db))
+                vmin = vmax - 80.0
+                q = ((np.clip(Sxx_db, vmin, vmax) - vmin)
+                     * (255.0 / 80.0)).astype(np.uint8)
+                result['power_q8'] = base64.b64encode(q.tobytes()).decode()
+                result['shape'] = list(q.shape)
+                result['vmin'] = vmin
+                result['vmax'] = vmax
+            else:
+                result['power_db'] = Sxx_db
+
+            self._cache_put(key, result)
+            return result
         except Exception as e:
-            logger.error(f"Error computing spectrogram: {str(e)}")
+            logger.error("Error computing spectrogram: %s", e)
             return {'error': str(e)}
 
+    def _cache_get(self, key) -> Optional[Dict]:
+        """Return a cached result if it is still within the TTL"""
+        hit = self.cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < self.cache_ttl:
+            return hit[1]
+        return None
+
+    def _cache_put(self, key, result: Dict):
+        """Store a result with the current timestamp"""
+        if len(self.cache) > 64:
+            self.cache.clear()
+        self.cache[key] = (time.monotonic(), result)
+
     def _compute_fft(self, data: np.ndarray) -> Dict:
         """Internal FFT computation"""
         n = len(data)
-        fft_vals = np.abs(fft(data))[:n // 2]
-        freqs = fftfreq(n, 1 / self.sampling_rate)[:n // 2]
+        fft_result = rfft(data, workers=-1)
+        freqs = _rfft_freqs(n, self.sampling_rate)
+
+        # dB scale straight from the power spectrum; only the dB values
+        # are returned here, so no sqrt pass is needed at all
+        power = fft_result.real ** 2 + fft_result.imag ** 2
+        dominant = _dominant_frequency(power, self.sampling_rate / n)
 
-        # dB scale
-        fft_db = 20 * np.log10(fft_vals + 1e-10)
-        fft_db = fft_db - np.max(fft_db)
+        # In-place dB conversion: power has no readers after this
+        power += 1e-20
+        fft_db = np.log10(power, out=power)
+        fft_db *= 10
+        fft_db -= np.max(fft_db)
 
         # Find peaks
         peaks, _ = signal.find_peaks(fft_db, height=-20)
 
         return {
-            'frequencies': freqs.tolist(),
-            'magnitude_db': fft_db.tolist(),
-            'peaks': peaks.tolist(),
-            'peak_frequencies': freqs[peaks].tolist() if len(peaks) > 0 else [],
+            'frequencies': freqs,
+            'magnitude_db': fft_db,
+            'peaks': peaks,
+            'peak_frequencies': freqs[peaks] if len(peaks) > 0 else [],
+            'dominant_frequency': dominant,
         }
 
     def _compute_spectrogram(self, data: np.ndarray) -> Dict:
@@ -208,29 +381,37 @@ class SpectrumAnalyzer:
         freqs, times, Sxx = signal.spectrogram(
             data,
             fs=self.sampling_rate,
-            window='hann',
-            nperseg=256,
+            window=_hann_window(256),
             noverlap=192,
             scaling='density'
         )
 
-        Sxx_db = 10 * np.log10(Sxx + 1e-10)
+        Sxx_db = np.ascontiguousarray(10 * np.log10(Sxx + 1e-10))
 
         return {
-            'frequencies': freqs.tolist(),
-            'times': times.tolist(),
-            'power_db': Sxx_db.tolist(),
+            'frequencies': freqs.astype(np.float32),
+            'times': times.astype(np.float32),
+            'power_db': Sxx_db,
         }
 
     def _compute_statistics(self, data: np.ndarray) -> Dict:
         """Compute statistics of time series"""
+        # Share the reductions: min/max feed peak_to_peak, and the first
+        # two moments give std and rms, so the data is traversed four
+        # times instead of eight. Accumulate in float64 even for float32
+        # input so the squared sums don't lose precision on long windows.
+        mean = float(np.mean(data, dtype=np.float64))
+        mean_sq = float(np.mean(np.square(data, dtype=np.float64)))
+        data_min = float(np.min(data))
+        data_max = float(np.max(data))
+        variance = max(mean_sq - mean * mean, 0.0)
         return {
-            'mean': float(np.mean(data)),
-            'std': float(np.std(data)),
-            'min': float(np.min(data)),
-            'max': float(np.max(data)),
-            'rms': float(np.sqrt(np.mean(data ** 2))),
-            'peak_to_peak': float(np.max(data) - np.min(data)),
+            'mean': mean,
+            'std': float(np.sqrt(variance)),
+            'min': data_min,
+            'max': data_max,
+            'rms': float(np.sqrt(mean_sq)),
+            'peak_to_peak': data_max - data_min,
         }
 
     def _get_sample_count(self, time_window: str) -> int:
@@ -264,16 +445,32 @@ class SpectrumAnalyzer:
         # waveform = device_manager.get_latest_waveform(device_id, channel, samples)
         # return np.array(waveform['data'])
 
-        # For now, generate synthetic seismic noise for testing
-        t = np.arange(samples) / self.sampling_rate
-        # Synthetic seismic noise with multiple frequency components
-        data = (
-            0.5 * np.sin(2 * np.pi * 2 * t) +  # 2 Hz component
-            0.3 * np.sin(2 * np.pi * 5 * t) +  # 5 Hz component
-            0.2 * np.sin(2 * np.pi * 10 * t) +  # 10 Hz component
-            0.1 * np.random.normal(0, 1, samples)  # Noise
-        )
-        return data
+        # For now, generate synthetic seismic noise for testing. The
+        # sum-of-sines baseline and a long noise buffer are computed
+        # once per sample count (the trig is the dominant cost and is
+        # input-independent); each call adds a freshly-offset slice of
+        # the noise so repeated requests still vary.
+        cached = self._synth_cache.get(samples)
+        if cached is None:
+            t = np.arange(samples) / self.sampling_rate
+            # Synthetic seismic noise with multiple frequency components
+            baseline = (
+                0.5 * np.sin(2 * np.pi * 2 * t) +  # 2 Hz component
+                0.3 * np.sin(2 * np.pi * 5 * t) +  # 5 Hz component
+                0.2 * np.sin(2 * np.pi * 10 * t)  # 10 Hz component
+            )
+            # float32 is plenty for 24-bit ADC data and halves the
+            # memory traffic through the FFT and spectrogram kernels
+            noise = 0.1 * np.random.normal(0, 1, samples + 1024)
+            cached = (
+                baseline.astype(np.float32),
+                noise.astype(np.float32),
+            )
+            self._synth_cache[samples] = cached
+
+        baseline, noise = cached
+        offset = np.random.randint(0, 1024)
+        return baseline + noise[offset:offset + samples]
 
 
 # Singleton instance
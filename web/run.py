@@ -69,12 +69,14 @@ def main():
     try:
         # Import and run the app
         from app import socketio, app
-        
+
+        # Debug defaults off: the reloader doubles startup cost and the
+        # debugger adds per-request overhead. Set FLASK_DEBUG=1 to opt in.
         socketio.run(
             app,
-            host='0.0.0.0',
-            port=5000,
-            debug=True,
+            host=os.environ.get('GEOTINY_HOST', '0.0.0.0'),
+            port=int(os.environ.get('GEOTINY_PORT', '5000')),
+            debug=os.environ.get('FLASK_DEBUG', '0') == '1',
             allow_unsafe_werkzeug=True
         )
     except ImportError as e: